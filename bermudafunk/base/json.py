@@ -13,7 +13,7 @@ class AttrEnumJSONEncoder(JSONEncoder):
             return {
                 "state": o.state.name,
                 "frequency": o.state.frequency,
-                "color": o.color,
+                "color": o.color.name,
             }
         if attr.has(type(o)):
             return attr.asdict(o, recurse=False)
@@ -1,7 +1,9 @@
 import asyncio
 import enum
 import functools
+import types
 import typing
+import weakref
 
 import attr
 
@@ -9,10 +11,10 @@ from bermudafunk.io.common import BaseButton, BaseTriColorLamp, TriColorLampStat
 from bermudafunk.io.dummy import DummyTriColorLamp
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class StudioLampState:
-    main: TriColorLampState = attr.ib(factory=TriColorLampState, validator=attr.validators.instance_of(TriColorLampState))
-    immediate: TriColorLampState = attr.ib(factory=TriColorLampState, validator=attr.validators.instance_of(TriColorLampState))
+    main: TriColorLampState = attr.ib(factory=TriColorLampState.of, validator=attr.validators.instance_of(TriColorLampState))
+    immediate: TriColorLampState = attr.ib(factory=TriColorLampState.of, validator=attr.validators.instance_of(TriColorLampState))
 
 
 @enum.unique
@@ -23,7 +25,12 @@ class Button(enum.Enum):
 
 
 class BaseStudio:
-    names: typing.Dict[str, "BaseStudio"] = {}
+    # weak registry, a studio which isn't used anymore doesn't block its name
+    _names: typing.MutableMapping[str, "BaseStudio"] = weakref.WeakValueDictionary()
+    names: typing.Mapping[str, "BaseStudio"] = types.MappingProxyType(_names)
+
+    # __weakref__ keeps the studios usable as values of the weak name registry
+    __slots__ = ("_name", "_main_lamp", "_immediate_lamp", "dispatcher_button_event_queue", "__weakref__")
 
     def __init__(
         self,
@@ -32,9 +39,9 @@ class BaseStudio:
         immediate_lamp: BaseTriColorLamp = None,
     ):
         self._name = name
-        if name in BaseStudio.names.keys():
+        if BaseStudio._names.get(name) is not None:
             raise ValueError("name already used %s" % name)
-        BaseStudio.names[name] = self
+        BaseStudio._names[name] = self
 
         self._main_lamp = main_lamp if main_lamp else DummyTriColorLamp(name="main dummy of " + name)
         self._immediate_lamp = immediate_lamp if immediate_lamp else DummyTriColorLamp(name="immediate dummy of " + name)
@@ -67,11 +74,15 @@ class BaseStudio:
 
 
 class Automat(BaseStudio):
+    __slots__ = ()
+
     def __init__(self, main_lamp: BaseTriColorLamp = None):
         super().__init__(name="Automat", main_lamp=main_lamp)
 
 
 class Studio(BaseStudio):
+    __slots__ = ("_takeover_button", "_release_button", "_immediate_button")
+
     def __init__(
         self,
         name: str,
@@ -1,9 +1,10 @@
 import asyncio
+import inspect
 import json
 import logging
 import random
+import sys
 import typing
-import weakref
 from datetime import datetime
 
 import attr
@@ -21,12 +22,16 @@ logger = logging.getLogger(__name__)
 
 audit_logger = logging.Logger(__name__)
 if not audit_logger.hasHandlers():
-    import sys
-
     stdout_handler = logging.StreamHandler(stream=sys.stdout)
     audit_logger.addHandler(stdout_handler)
 
 
+def _caller_line_number() -> int:
+    """Line number from which the function calling this helper was called"""
+    # only the calling frames are needed, inspect.stack() would collect the source context of every frame
+    return inspect.currentframe().f_back.f_back.f_lineno
+
+
 class Dispatcher:
     """
     This is the main state machine handler of bermudafunk
@@ -69,10 +74,7 @@ class Dispatcher:
             def _x_set(_self, new_val: Studio):
                 if _self.__x is new_val:
                     return
-                import inspect
-
-                stack = inspect.stack()
-                logger.debug("stack %s", stack[1].lineno)
+                logger.debug("stack %s", _caller_line_number())
                 logger.debug("change _x to %s", new_val)
                 _self.__x = new_val
 
@@ -82,10 +84,7 @@ class Dispatcher:
             def _y_set(_self, new_val: Studio):
                 if _self.__y is new_val:
                     return
-                import inspect
-
-                stack = inspect.stack()
-                logger.debug("stack %s", stack[1].lineno)
+                logger.debug("stack %s", _caller_line_number())
                 logger.debug("change _y to %s", new_val)
                 _self.__y = new_val
 
@@ -93,7 +92,7 @@ class Dispatcher:
                 return _self.__on_air_selector_value
 
             def _on_air_selector_value_set(_self, new_val: int):
-                if _self.__on_air_selector_value is new_val:
+                if _self.__on_air_selector_value == new_val:
                     return
                 logger.debug("change _on_air_selector_value to %s", new_val)
                 _self.__on_air_selector_value = new_val
@@ -184,7 +183,7 @@ class Dispatcher:
                 del transition["switch_xy"]
             self._machine.add_transition(**transition)
 
-        self._machine_observers: typing.Set[typing.Callable[[Dispatcher, EventData], typing.Any]] = weakref.WeakSet()
+        self._machine_observers: typing.Set[typing.Callable[[Dispatcher, EventData], typing.Any]] = set()
 
         self._started = False
 
@@ -203,7 +202,8 @@ class Dispatcher:
         base.cleanup_tasks.append(asyncio.create_task(self._cleanup()))
 
     def _notify_machine_observers(self, event: EventData):
-        for observer in self._machine_observers:
+        # iterate over a copy, observers may unregister themselves
+        for observer in tuple(self._machine_observers):
             observer(self, event)
 
     @property
@@ -311,12 +311,13 @@ class Dispatcher:
 
             # if the button press can be mapped to a studio trigger the machine
             trigger_name = event.button.name + append
-            logger.debug("state %s", {"state": self._machine.state, "x": self._x, "y": self._y})
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("state %s", {"state": self._machine.state, "x": self._x, "y": self._y})
             logger.debug("trigger_name trying to call %s", trigger_name)
             # noinspection PyBroadException
             try:
                 self._machine.trigger(trigger_name, button_event=event)
-            except:
+            except Exception:
                 logger.warning("Unable to process trigger %s of studio %s", trigger_name, event.studio.name)
                 self._signal_error_task = asyncio.create_task(self._signal_error(event.studio))
                 continue
@@ -326,7 +327,7 @@ class Dispatcher:
             self._assure_lamp_state()
 
     async def _signal_error(self, studio: Studio):
-        studio.immediate_lamp.color_lamp_state = common.TriColorLampState(
+        studio.immediate_lamp.color_lamp_state = common.TriColorLampState.of(
             state=common.LampState.BLINK_REALLY_FAST,
             color=common.TriColorLampColor.RED,
         )
@@ -374,7 +375,7 @@ class Dispatcher:
             try:
                 await self._set_current_state()
             except Exception as e:
-                logger.error("Exception during assuring the desired state of the symnet controller", e)
+                logger.error("Exception during assuring the desired state of the symnet controller: %s", e)
             sleep_time = random.randint(300, 600)
             logger.debug("Sleep for %s seconds", sleep_time)
             await asyncio.sleep(sleep_time)
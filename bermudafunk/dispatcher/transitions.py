@@ -16,7 +16,7 @@ GraphMachine.style_attributes["node"]["default"]["shape"] = "octagon"
 GraphMachine.style_attributes["node"]["active"]["shape"] = "doubleoctagon"
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class LampStateTarget:
     automat: data_types.StudioLampState = attr.ib(validator=attr.validators.instance_of(data_types.StudioLampState))
     x: data_types.StudioLampState = attr.ib(validator=attr.validators.instance_of(data_types.StudioLampState))
@@ -66,37 +66,37 @@ def load_states():
         name = state_data["name"]
         lamp_state_target = LampStateTarget(
             automat=data_types.StudioLampState(
-                main=common.TriColorLampState(
+                main=common.TriColorLampState.of(
                     state=common.LampState[state_data["automat_main_state"].upper()],
                     color=common.TriColorLampColor[state_data["automat_main_color"].upper()],
                 ),
             ),
             x=data_types.StudioLampState(
-                main=common.TriColorLampState(
+                main=common.TriColorLampState.of(
                     state=common.LampState[state_data["x_main_state"].upper()],
                     color=common.TriColorLampColor[state_data["x_main_color"].upper()],
                 ),
-                immediate=common.TriColorLampState(
+                immediate=common.TriColorLampState.of(
                     state=common.LampState[state_data["x_immediate_state"].upper()],
                     color=common.TriColorLampColor[state_data["x_immediate_color"].upper()],
                 ),
             ),
             y=data_types.StudioLampState(
-                main=common.TriColorLampState(
+                main=common.TriColorLampState.of(
                     state=common.LampState[state_data["y_main_state"].upper()],
                     color=common.TriColorLampColor[state_data["y_main_color"].upper()],
                 ),
-                immediate=common.TriColorLampState(
+                immediate=common.TriColorLampState.of(
                     state=common.LampState[state_data["y_immediate_state"].upper()],
                     color=common.TriColorLampColor[state_data["y_immediate_color"].upper()],
                 ),
             ),
             other=data_types.StudioLampState(
-                main=common.TriColorLampState(
+                main=common.TriColorLampState.of(
                     state=common.LampState[state_data["other_main_state"].upper()],
                     color=common.TriColorLampColor[state_data["other_main_color"].upper()],
                 ),
-                immediate=common.TriColorLampState(
+                immediate=common.TriColorLampState.of(
                     state=common.LampState[state_data["other_immediate_state"].upper()],
                     color=common.TriColorLampColor[state_data["other_immediate_color"].upper()],
                 ),
@@ -139,10 +139,10 @@ def check_states_ignore_immediate_lamp(states):
         lst = state.lamp_state_target
         modified_states[state.name] = attr.evolve(
             lst,
-            x=attr.evolve(lst.x, immediate=common.TriColorLampState()),
-            y=attr.evolve(lst.y, immediate=common.TriColorLampState()),
-            other=attr.evolve(lst.other, immediate=common.TriColorLampState()),
+            x=attr.evolve(lst.x, immediate=common.TriColorLampState.of()),
+            y=attr.evolve(lst.y, immediate=common.TriColorLampState.of()),
+            other=attr.evolve(lst.other, immediate=common.TriColorLampState.of()),
         )
     for state1, state2 in itertools.combinations(modified_states.keys(), 2):
         if modified_states[state1] == modified_states[state2]:
-            logger.warning("Duplicate lamp state ignoring immediate on states {} & {}".format(state1, state2))
+            logger.warning("Duplicate lamp state ignoring immediate on states %s & %s", state1, state2)
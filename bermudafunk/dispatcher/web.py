@@ -2,7 +2,7 @@ import asyncio
 import functools
 import logging
 import threading
-import weakref
+import typing
 from concurrent.futures import ThreadPoolExecutor
 
 import aiohttp
@@ -17,7 +17,13 @@ from bermudafunk.dispatcher.dispatcher import Dispatcher
 logger = logging.getLogger(__name__)
 
 _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="GraphRenderer")
-_websockets = weakref.WeakSet()
+# every websocket handler discards its socket when it ends
+_websockets: typing.Set[web.WebSocketResponse] = set()
+
+
+def _connected_websockets() -> typing.Tuple[web.WebSocketResponse, ...]:
+    # snapshot, sockets may connect or disconnect while the caller awaits on them
+    return tuple(_websockets)
 
 
 def redraw_complete_graph(dispatcher: Dispatcher):
@@ -106,12 +112,13 @@ async def run(dispatcher: Dispatcher, ukw_selector: SymNetSelectorController):
         ws = web.WebSocketResponse()
         await ws.prepare(request)
 
-        _websockets.add(ws)
-        await ws.send_str(dispatcher_status_msg())
-        for studio in dispatcher.studios_with_automat:
-            await ws.send_str(lamp_state_msg(studio))
-
         try:
+            # registered inside the try, the socket is discarded again even if the client drops during the first sends
+            _websockets.add(ws)
+            await ws.send_str(dispatcher_status_msg())
+            for studio in dispatcher.studios_with_automat:
+                await ws.send_str(lamp_state_msg(studio))
+
             async for msg in ws:
                 if msg.type == aiohttp.WSMsgType.TEXT:
                     logger.debug(msg.data)
@@ -142,7 +149,7 @@ async def run(dispatcher: Dispatcher, ukw_selector: SymNetSelectorController):
 
     async def close_remaining_websockets():
         logger.debug("closing remaining websockets")
-        for ws in set(_websockets):
+        for ws in _connected_websockets():
             await ws.close(code=aiohttp.WSCloseCode.GOING_AWAY, message="Server shutdown")
 
     def dispatcher_observer(*_, **__):
@@ -151,7 +158,7 @@ async def run(dispatcher: Dispatcher, ukw_selector: SymNetSelectorController):
     async def dispatcher_observer_push():
         while True:
             await dispatcher_observer_event.wait()
-            for ws in _websockets:
+            for ws in _connected_websockets():
                 await ws.send_str(dispatcher_status_msg())
                 for studio in dispatcher.studios_with_automat:
                     await ws.send_str(lamp_state_msg(studio))
@@ -163,7 +170,7 @@ async def run(dispatcher: Dispatcher, ukw_selector: SymNetSelectorController):
     async def lamp_observer_push():
         while True:
             await lamp_observer_event.wait()
-            for ws in _websockets:
+            for ws in _connected_websockets():
                 for studio in dispatcher.studios_with_automat:
                     await ws.send_str(lamp_state_msg(studio))
             lamp_observer_event.clear()
@@ -191,6 +198,9 @@ async def run(dispatcher: Dispatcher, ukw_selector: SymNetSelectorController):
             await asyncio.sleep(3600)
     except asyncio.CancelledError:
         pass
+    dispatcher.machine_observers.discard(dispatcher_observer)
+    for studio_ in dispatcher.studios:
+        studio_.immediate_lamp.remove_observer(lamp_observer)
     dispatcher_observer_push_task.cancel()
     lamp_observer_push_task.cancel()
     await close_remaining_websockets()
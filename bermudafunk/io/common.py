@@ -1,11 +1,11 @@
 import abc
 import asyncio
-import collections.abc
 import enum
-import functools
+import heapq
 import inspect
 import itertools
 import logging
+import math
 import threading
 import time
 import typing
@@ -16,41 +16,70 @@ import attr
 logger = logging.getLogger(__name__)
 
 
+def _create_observer_task(observer: Callable):
+    asyncio.create_task(observer())
+
+
 class Observable:
+    __slots__ = ("__sync_observer", "__async_observer", "__observer_snapshot")
+
     loop: typing.ClassVar[Optional[asyncio.BaseEventLoop]] = None
 
     def __init__(self):
-        self.__observer: Set[Callable] = set()
+        # observers are classified once on registration, so dispatching doesn't need to inspect them
+        self.__sync_observer: Set[Callable] = set()
+        self.__async_observer: Set[Callable] = set()
+        # immutable copies of both sets for dispatching, refreshed on every registration change
+        self.__observer_snapshot: typing.Tuple[typing.Tuple[Callable, ...], typing.Tuple[Callable, ...]] = ((), ())
 
     def add_observer(self, handler: Callable):
-        if not isinstance(handler, collections.abc.Hashable):
-            raise TypeError("The supplied handler isn't hashable")
+        try:
+            hash(handler)
+        except TypeError:
+            raise TypeError("The supplied handler isn't hashable") from None
         if not callable(handler):
             raise TypeError("The supplied handler isn't callable")
-        self.__observer.add(handler)
+        # also recognizes functools.partial wrapped coroutine functions
+        if inspect.iscoroutinefunction(handler):
+            self.__async_observer.add(handler)
+        else:
+            self.__sync_observer.add(handler)
+        self.__refresh_observer_snapshot()
 
     def remove_observer(self, handler: Callable):
-        if not isinstance(handler, collections.abc.Hashable):
-            raise TypeError("The supplied handler isn't hashable")
-        if not callable(handler):
-            raise TypeError("The supplied handler isn't callable")
-        self.__observer.remove(handler)
+        # no type checks needed, add_observer never accepts anything unhashable or not callable
+        if handler in self.__async_observer:
+            self.__async_observer.remove(handler)
+        else:
+            self.__sync_observer.remove(handler)
+        self.__refresh_observer_snapshot()
+
+    def __refresh_observer_snapshot(self):
+        self.__observer_snapshot = (tuple(self.__sync_observer), tuple(self.__async_observer))
 
     def _trigger_observers(self, *_, **__):
-        for observer in self.__observer:
-            if inspect.iscoroutinefunction(observer) or (
-                isinstance(observer, functools.partial) and inspect.iscoroutinefunction(observer.func)
-            ):
-                if self.loop:
-                    asyncio.run_coroutine_threadsafe(observer(), self.loop)
-            else:
-                observer()
+        sync_observers, async_observers = self.__observer_snapshot
+        for observer in sync_observers:
+            observer()
+        loop = self.loop
+        if loop and async_observers:
+            try:
+                on_loop_thread = asyncio.get_running_loop() is loop
+            except RuntimeError:
+                on_loop_thread = False
+            for observer in async_observers:
+                if on_loop_thread:
+                    loop.create_task(observer())
+                else:
+                    # fire and forget, no need for the concurrent future of run_coroutine_threadsafe
+                    loop.call_soon_threadsafe(_create_observer_task, observer)
 
 
 class BaseButton(abc.ABC, Observable):
+    __slots__ = ("_name",)
+
     def __init__(self, name: str):
         super().__init__()
-        self.__trigger: Set[Callable] = set()
         self._name = str(name)
 
     @property
@@ -63,28 +92,39 @@ class BaseButton(abc.ABC, Observable):
 
 @enum.unique
 class LampState(enum.Enum):
-    OFF = 0
-    ON = 0
-    BLINK = 2
-    BLINK_FAST = 6
-    BLINK_REALLY_FAST = 10
-
-    def __new__(cls, frequency: float):
-        value = len(cls.__members__) + 1
-        obj = object.__new__(cls)
-        obj._frequency = float(frequency)
-        obj._value_ = value
-        return obj
+    OFF = 1
+    ON = 2
+    BLINK = 3
+    BLINK_FAST = 4
+    BLINK_REALLY_FAST = 5
 
     @property
     def frequency(self) -> float:
-        return self._frequency
+        return _LAMP_STATE_FREQUENCIES[self]
 
     def __repr__(self):
         return f"{self.__class__.__name__}.{self.name}"
 
 
+# blink frequency of each lamp state, 0 for the steady states
+_LAMP_STATE_FREQUENCIES: typing.Dict[LampState, float] = {
+    LampState.OFF: 0.0,
+    LampState.ON: 0.0,
+    LampState.BLINK: 2.0,
+    LampState.BLINK_FAST: 6.0,
+    LampState.BLINK_REALLY_FAST: 10.0,
+}
+
+# realizes each of the steady (frequency 0) lamp states on the given lamp
+_STEADY_STATE_CALLABLES: typing.Dict[LampState, Callable[["BaseLamp"], None]] = {
+    LampState.OFF: lambda lamp: lamp._off_callable(),
+    LampState.ON: lambda lamp: lamp._on_callable(),
+}
+
+
 class BaseLamp(abc.ABC, Observable):
+    __slots__ = ("_name", "_state", "_lock", "_blinker", "_on_callable", "_off_callable")
+
     def __init__(
         self,
         name: str,
@@ -98,7 +138,7 @@ class BaseLamp(abc.ABC, Observable):
         if not isinstance(state, LampState):
             raise TypeError(f"This supports only values of {LampState}")
         self._state = state
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
         self._blinker: Optional[Blinker] = None
 
         self._on_callable = on_callable
@@ -116,43 +156,48 @@ class BaseLamp(abc.ABC, Observable):
 
     @state.setter
     def state(self, new_state: LampState):
+        if new_state is self._state:
+            # nothing to do, skip the type check and the lock
+            return
         logger.debug("Lamp with name <%s> set state <%s>", self.name, new_state)
         if not isinstance(new_state, LampState):
             raise TypeError(f"This supports only values of {LampState}")
         with self._lock:
-            if self._state is not new_state:
-                self._state = new_state
-                self._assure_state()
-                self._trigger_observers()
+            if self._state is new_state:
+                return
+            self._state = new_state
+            self._assure_state()
+        # observers may take their time, don't let them block the lamp
+        self._trigger_observers()
 
     def _assure_state(self):
-        if self._state.frequency > 0:
+        state = self._state
+        frequency = state.frequency
+        if frequency > 0:
             if self._blinker is None:
                 self._blinker = Blinker(
-                    name=f"Blinker thread of lamp {self.name}",
-                    frequency=self._state.frequency,
+                    name=f"Blinker of lamp {self._name}",
+                    frequency=frequency,
                     output_caller=[self._on_callable, self._off_callable],
                 )
-                self._blinker.start()
             else:
-                self._blinker.frequency = self._state.frequency
+                self._blinker.frequency = frequency
+            self._blinker.start()
         else:
             if self._blinker is not None:
                 self._blinker.stop()
-                self._blinker = None
-            if self._state is LampState.OFF:
-                self._off_callable()
-            elif self._state is LampState.ON:
-                self._on_callable()
-            else:
-                raise ValueError(f"Unknown lamp state with frequency 0: {self._state!r}")
+            try:
+                steady_callable = _STEADY_STATE_CALLABLES[state]
+            except KeyError:
+                raise ValueError(f"Unknown lamp state with frequency 0: {state!r}") from None
+            steady_callable(self)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name={self._name!r}, state={self._state!r})"
 
 
 @enum.unique
-class TriColorLampColor(enum.Flag):
+class TriColorLampColor(enum.IntFlag):
     NONE = 0
     GREEN = enum.auto()
     RED = enum.auto()
@@ -161,14 +206,50 @@ class TriColorLampColor(enum.Flag):
     def __repr__(self):
         return f"{self.__class__.__name__}.{self.name}"
 
+    # IntFlag would format as a plain int, keep the enum style for logging
+    __str__ = __repr__
+
+
+# IntFlag accepts any combination of bits, but a lamp can only show the declared colors
+_TRI_COLOR_LAMP_COLORS: typing.FrozenSet[TriColorLampColor] = frozenset(TriColorLampColor.__members__.values())
 
-@attr.s(frozen=True, slots=True)
+
+def _check_tri_color_lamp_color(color: TriColorLampColor):
+    if not isinstance(color, TriColorLampColor):
+        raise TypeError(f"This supports only values of {TriColorLampColor}")
+    if color not in _TRI_COLOR_LAMP_COLORS:
+        raise ValueError(f"Unknown tri color lamp color {int(color)}")
+
+
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class TriColorLampState:
     state: LampState = attr.ib(default=LampState.OFF, validator=attr.validators.instance_of(LampState))
-    color: TriColorLampColor = attr.ib(default=TriColorLampColor.NONE, validator=attr.validators.instance_of(TriColorLampColor))
+    color: TriColorLampColor = attr.ib(
+        default=TriColorLampColor.NONE,
+        validator=[attr.validators.instance_of(TriColorLampColor), attr.validators.in_(_TRI_COLOR_LAMP_COLORS)],
+    )
+
+    @classmethod
+    def of(cls, state: LampState = LampState.OFF, color: TriColorLampColor = TriColorLampColor.NONE) -> "TriColorLampState":
+        """Return the shared instance for the state and color, lamps compare them by identity first"""
+        try:
+            return _TRI_COLOR_LAMP_STATES[state, color]
+        except KeyError:
+            # not a valid combination, let the validators raise
+            return cls(state=state, color=color)
+
+
+# the state space is tiny, so lamps hand out shared instances instead of building a new one on every read
+_TRI_COLOR_LAMP_STATES: typing.Dict[typing.Tuple[LampState, TriColorLampColor], TriColorLampState] = {
+    (state, color): TriColorLampState(state=state, color=color)
+    for state in LampState.__members__.values()
+    for color in TriColorLampColor.__members__.values()
+}
 
 
 class BaseTriColorLamp(BaseLamp):
+    __slots__ = ("_color",)
+
     def __init__(
         self,
         name: str,
@@ -177,8 +258,7 @@ class BaseTriColorLamp(BaseLamp):
         state: LampState,
         color: TriColorLampColor,
     ):
-        if not isinstance(color, TriColorLampColor):
-            raise TypeError(f"This supports only values of {TriColorLampColor}")
+        _check_tri_color_lamp_color(color)
         self._color = color
         super().__init__(
             name=name,
@@ -193,44 +273,63 @@ class BaseTriColorLamp(BaseLamp):
 
     @color.setter
     def color(self, new_color: TriColorLampColor):
+        if new_color is self._color:
+            return
         logger.debug("Lamp with name <%s> set color <%s>", self.name, new_color)
-        if not isinstance(new_color, TriColorLampColor):
-            raise TypeError(f"This supports only values of {TriColorLampColor}")
+        _check_tri_color_lamp_color(new_color)
         with self._lock:
-            if self._color is not new_color:
-                self._color = new_color
-                self._trigger_observers()
-                self._assure_state()
+            if self._color is new_color:
+                return
+            self._color = new_color
+            self._assure_state()
+        self._trigger_observers()
 
     @property
     def color_lamp_state(self) -> TriColorLampState:
-        with self._lock:
-            return TriColorLampState(color=self._color, state=self._state)
+        # a plain read of both references, writers replace them under the lock
+        state, color = self._state, self._color
+        return _TRI_COLOR_LAMP_STATES[state, color]
 
     @color_lamp_state.setter
     def color_lamp_state(self, new_color_lamp_state: TriColorLampState):
+        if new_color_lamp_state is self.color_lamp_state:
+            return
         if not isinstance(new_color_lamp_state, TriColorLampState):
             raise TypeError(f"This supports only values of {TriColorLampState}")
         with self._lock:
-            if self.color_lamp_state != new_color_lamp_state:
-                self._state = new_color_lamp_state.state
-                self._color = new_color_lamp_state.color
-                self._assure_state()
-                self._trigger_observers()
+            if self._state is new_color_lamp_state.state and self._color is new_color_lamp_state.color:
+                return
+            self._state = new_color_lamp_state.state
+            self._color = new_color_lamp_state.color
+            self._assure_state()
+        self._trigger_observers()
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(name={self._name!r}, state={self._state!r}, color={self._color!r})"
 
 
-class Blinker(threading.Thread):
-    def __init__(self, output_caller: List[Callable[[], None]], frequency: float, name="Blinker Thread"):
-        super().__init__(name=name, daemon=True)
-        self._output_caller = output_caller
+class Blinker:
+    """Periodically calls the output callables in turn, driven by the shared BlinkerScheduler thread
+
+    The output calls are aligned to a common time grid of the blink period, so all blinkers with the same
+    frequency switch at the same instants and in the same phase.
+    A blinker can be stopped and started again, so a lamp keeps the same blinker for its whole lifetime.
+    """
+
+    __slots__ = ("_name", "_output_caller", "_frequency", "_time_to_sleep", "_lock", "_stopped", "_generation")
+
+    def __init__(self, output_caller: List[Callable[[], None]], frequency: float, name="Blinker"):
+        self._name = name
+        self._output_caller = tuple(output_caller)
 
         self._frequency = frequency
         self._time_to_sleep = 1 / frequency
 
-        self._stop_event = threading.Event()
+        # serializes output calls with stop(), no output is called after stop() returned
+        self._lock = threading.Lock()
+        self._stopped = True
+        # bumped on every start, scheduler entries of an earlier run are dropped
+        self._generation = 0
 
     @property
     def frequency(self) -> float:
@@ -240,15 +339,105 @@ class Blinker(threading.Thread):
     def frequency(self, new_frequency: float):
         if not isinstance(new_frequency, (float, int)):
             raise TypeError("Frequency have to be a float or int")
+        if new_frequency == self._frequency:
+            return
         self._frequency = new_frequency
         self._time_to_sleep = 1 / new_frequency
+        BlinkerScheduler.instance().reschedule(self)
 
-    def run(self):
-        for caller in itertools.cycle(self._output_caller):
-            caller()
-            time.sleep(self._time_to_sleep)
-            if self._stop_event.is_set():
-                break
+    @property
+    def stopped(self) -> bool:
+        return self._stopped
+
+    def start(self):
+        with self._lock:
+            if not self._stopped:
+                return
+            self._stopped = False
+            self._generation += 1
+            generation = self._generation
+        BlinkerScheduler.instance().schedule(self, time.monotonic(), generation)
 
     def stop(self):
-        self._stop_event.set()
+        with self._lock:
+            self._stopped = True
+
+    def _next_deadline(self, now: float) -> float:
+        return (math.floor(now / self._time_to_sleep) + 1) * self._time_to_sleep
+
+    def _tick(self, generation: int) -> Optional[float]:
+        """Call the output callable of the current grid slot, returns the next deadline or None if this run is over"""
+        with self._lock:
+            if self._stopped or generation != self._generation:
+                return None
+            period = self._time_to_sleep
+            # the nearest grid point, a slightly late or the first unaligned call still belongs to it
+            slot = round(time.monotonic() / period)
+            try:
+                self._output_caller[slot % len(self._output_caller)]()
+            except Exception:
+                logger.exception("Output call of %r failed", self)
+            return (slot + 1) * period
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self._name!r}, frequency={self._frequency!r})"
+
+
+class BlinkerScheduler(threading.Thread):
+    """A single daemon thread which drives all running blinkers, ordered by their next deadline"""
+
+    _instance: typing.ClassVar[Optional["BlinkerScheduler"]] = None
+    _instance_lock: typing.ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self):
+        super().__init__(name="Blinker scheduler thread", daemon=True)
+        self._condition = threading.Condition()
+        # heap of (deadline, sequence number, blinker, generation); the sequence number keeps the ordering stable
+        self._queue: List[typing.Tuple[float, int, Blinker, int]] = []
+        self._sequence = itertools.count()
+
+    @classmethod
+    def instance(cls) -> "BlinkerScheduler":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                cls._instance.start()
+            return cls._instance
+
+    def schedule(self, blinker: Blinker, deadline: float, generation: int):
+        with self._condition:
+            heapq.heappush(self._queue, (deadline, next(self._sequence), blinker, generation))
+            self._condition.notify()
+
+    def reschedule(self, blinker: Blinker):
+        """Move the pending deadline of the blinker to the next grid point of its current frequency"""
+        with self._condition:
+            for index, (_, sequence, queued_blinker, generation) in enumerate(self._queue):
+                if queued_blinker is blinker and generation == blinker._generation:
+                    self._queue[index] = (blinker._next_deadline(time.monotonic()), sequence, blinker, generation)
+                    heapq.heapify(self._queue)
+                    self._condition.notify()
+                    return
+
+    def run(self):
+        while True:
+            with self._condition:
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+                now = time.monotonic()
+                timeout = self._queue[0][0] - now
+                if timeout > 0:
+                    # a new blinker may be scheduled earlier, so re-evaluate the queue after waking up
+                    self._condition.wait(timeout)
+                    continue
+                # blinkers of the same frequency share their deadlines, handle them in one go
+                due = []
+                while self._queue and self._queue[0][0] <= now:
+                    due.append(heapq.heappop(self._queue))
+
+            # call the outputs outside of the condition, they may block on hardware locks
+            for _, _, blinker, generation in due:
+                next_deadline = blinker._tick(generation)
+                if next_deadline is not None:
+                    self.schedule(blinker, next_deadline, generation)
@@ -8,26 +8,32 @@ logger = logging.getLogger(__name__)
 
 
 class DummyButton(common.BaseButton):
+    __slots__ = ()
+
     def add_observer(self, handler: typing.Callable):
         super().add_observer(handler)
-        logger.info("Added handler {} to button {}".format(handler, self.name))
+        logger.info("Added handler %s to button %s", handler, self.name)
 
     def remove_observer(self, handler: typing.Callable):
         super().remove_observer(handler)
-        logger.info("Removed handler {} to button {}".format(handler, self.name))
+        logger.info("Removed handler %s to button %s", handler, self.name)
 
 
 class DummyLamp(common.BaseLamp):
+    __slots__ = ()
+
     def __init__(self, name: str, state: common.LampState = common.LampState.OFF):
         super().__init__(
             name=name,
-            on_callable=functools.partial(logger.debug, "Dummy Lamp <{}> ON".format(name)),
-            off_callable=functools.partial(logger.debug, "Dummy Lamp <{}> OFF".format(name)),
+            on_callable=functools.partial(logger.debug, "Dummy Lamp <%s> ON", name),
+            off_callable=functools.partial(logger.debug, "Dummy Lamp <%s> OFF", name),
             state=state,
         )
 
 
 class DummyTriColorLamp(common.BaseTriColorLamp):
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -36,14 +42,16 @@ class DummyTriColorLamp(common.BaseTriColorLamp):
     ):
         super().__init__(
             name=name,
-            on_callable=self._on_callable,
-            off_callable=self._off_callable,
+            on_callable=self._lamp_on,
+            off_callable=self._lamp_off,
             state=state,
             color=color,
         )
 
-    def _on_callable(self):
-        logger.debug("Dummy Lamp <%s> with color <%s> ON", self.name, self.color)
+    def _lamp_on(self):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dummy Lamp <%s> with color <%s> ON", self._name, self._color)
 
-    def _off_callable(self):
-        logger.debug("Dummy Lamp <%s> with color <%s> OFF", self.name, self.color)
+    def _lamp_off(self):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dummy Lamp <%s> with color <%s> OFF", self._name, self._color)
@@ -1,6 +1,7 @@
 import functools
 import logging
 import typing
+import weakref
 
 import RPi.GPIO
 
@@ -9,6 +10,11 @@ from bermudafunk.io import common
 logger = logging.getLogger(__name__)
 
 
+def _cleanup_pin(pin: int):
+    RPi.GPIO.cleanup(pin)
+    GPIO._used_pins.discard(pin)
+
+
 class GPIO:
     _used_pins: typing.Set[int] = set()
     _initialized = False
@@ -45,13 +51,15 @@ class GPIO:
             GPIO._initialized = True
 
         RPi.GPIO.setup(pin, direction, initial=initial, pull_up_down=pull_up_down)
+        # releases the pin even if close() is never called, without the pitfalls of __del__
+        self._finalizer = weakref.finalize(self, _cleanup_pin, pin)
 
     @property
     def pin(self) -> int:
         return self._pin
 
-    def __del__(self):
-        RPi.GPIO.cleanup(self._pin)
+    def close(self):
+        self._finalizer()
 
     def __repr__(self) -> str:
         return "{}(pin={!r}, direction={!r}, initial={!r}, pull_up_down={!r})".format(
@@ -80,9 +88,10 @@ class GPIOButton(common.BaseButton, GPIO):
         elif pull_up_down is RPi.GPIO.PUD_UP:
             RPi.GPIO.add_event_detect(pin, RPi.GPIO.FALLING, callback=self._trigger_observers, bouncetime=GPIOButton.DEBOUNCE_TIME)
 
-    def __del__(self):
-        RPi.GPIO.remove_event_detect(self.pin)
-        super().__del__()
+    def close(self):
+        if self._finalizer.alive:
+            RPi.GPIO.remove_event_detect(self._pin)
+        super().close()
 
     def __repr__(self) -> str:
         return "{}(name={!r}, pin={!r}, pull_up_down={!r}, internal_pull={!r})".format(
@@ -97,6 +106,9 @@ class GPIOButton(common.BaseButton, GPIO):
 class GPIOLamp(common.BaseLamp, GPIO):
     def __init__(self, name: str, pin: int):
         GPIO.__init__(self, pin, direction=RPi.GPIO.OUT, initial=RPi.GPIO.LOW)
+        # blinking is left to the PWM of RPi.GPIO instead of the blinker scheduler, created on the first blinking state
+        self._pwm: typing.Optional[RPi.GPIO.PWM] = None
+        self._pwm_running = False
         common.BaseLamp.__init__(
             self,
             name,
@@ -105,9 +117,29 @@ class GPIOLamp(common.BaseLamp, GPIO):
             state=common.LampState.OFF,
         )
 
-    def __del__(self):
-        self.state = common.LampState.OFF
-        super().__del__()
+    def _assure_state(self):
+        frequency = self._state.frequency
+        if frequency > 0:
+            # the lamp state frequency counts on and off phases, a PWM period contains both
+            if self._pwm is None:
+                self._pwm = RPi.GPIO.PWM(self._pin, frequency / 2)
+            else:
+                self._pwm.ChangeFrequency(frequency / 2)
+            if not self._pwm_running:
+                self._pwm.start(50)
+                self._pwm_running = True
+        else:
+            if self._pwm_running:
+                self._pwm.stop()
+                self._pwm_running = False
+            super()._assure_state()
+
+    def close(self):
+        if self._finalizer.alive:
+            self.state = common.LampState.OFF
+            # RPi.GPIO allows one PWM per pin, release it together with the pin
+            self._pwm = None
+        super().close()
 
     def __repr__(self) -> str:
         return "{}(name={!r}, pin={!r})".format(
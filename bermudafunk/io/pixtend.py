@@ -2,6 +2,8 @@ import enum
 import functools
 import logging
 import math
+import operator
+import os
 import struct
 import threading
 import time
@@ -28,40 +30,55 @@ else:
     timer = time.time
 
 
-def _calc_crc16(data):
+def _crc16_table_entry(index: int) -> int:
+    crc = index
+    for _ in range(8):
+        if crc & 1:
+            crc = (crc >> 1) ^ 0xA001
+        else:
+            crc = crc >> 1
+    return crc
+
+
+# CRC-16 (poly 0xA001, reflected) of every byte value, the checksum is then computed byte wise instead of bit wise
+_CRC16_TABLE: typing.Tuple[int, ...] = tuple(_crc16_table_entry(index) for index in range(256))
+
+
+def _calc_crc16(data, _table=_CRC16_TABLE):
     crc = 0xFFFF
 
     for b in data:
-        crc = crc ^ b
-
-        for i in range(0, 8, 1):
-            if crc & 1:
-                crc = (crc >> 1) ^ 0xA001
-            else:
-                crc = crc >> 1
+        crc = (crc >> 8) ^ _table[(crc ^ b) & 0xFF]
 
     return crc
 
 
+def _set_bit(value: int, bit: int, val: bool) -> int:
+    return (value & ~(1 << bit)) | (bool(val) << bit)
+
+
 def _bit_getter(field_name, bit, doc=None):
+    mask = 1 << bit
+    get_field = operator.attrgetter(field_name)
+
     def getter(instance) -> bool:
         with instance.transfer_lock:
-            return instance.__dict__[field_name] & (1 << bit) > 0
+            return get_field(instance) & mask != 0
 
     return property(fget=getter, doc=doc)
 
 
 def _bit_getter_setter(field_name, bit, doc=None):
+    mask = 1 << bit
+    get_field = operator.attrgetter(field_name)
+
     def getter(instance) -> bool:
         with instance.transfer_lock:
-            return instance.__dict__[field_name] & (1 << bit) > 0
+            return get_field(instance) & mask != 0
 
     def setter(instance, val: bool):
         with instance.transfer_lock:
-            if val:
-                instance.__dict__[field_name] |= 1 << bit
-            else:
-                instance.__dict__[field_name] &= ~(1 << bit)
+            setattr(instance, field_name, (get_field(instance) & ~mask) | (mask if val else 0))
 
     return property(fget=getter, fset=setter, doc=doc)
 
@@ -126,22 +143,81 @@ class Pixtend(common.Observable):
 
     OUT_HEADER = struct.Struct("<4B 3x")
     OUT_DATA = struct.Struct("<8B H B 4B B3H B3H B3H 64s")
-    OUT_FORMAT = struct.Struct("<7s H 100s H")
+    CRC = struct.Struct("<H")
+
+    # conversion of the raw analog input values to volt and ampere
+    ANALOG_VOLTAGE_SCALE = 10 / 1024
+    ANALOG_CURRENT_SCALE = 0.020158400229358
+
+    # offsets of the input parts inside a transfer, according to IN_FORMAT_HEADER and IN_FORMAT_DATA
+    IN_HEADER_CRC_OFFSET = IN_HEADER.size
+    IN_DATA_OFFSET = IN_FORMAT_HEADER.size
+    IN_DATA_CRC_OFFSET = IN_DATA_OFFSET + IN_DATA.size
+
+    # offsets of the output parts inside a transfer: header, header crc, data, data crc
+    OUT_HEADER_CRC_OFFSET = OUT_HEADER.size
+    OUT_DATA_OFFSET = OUT_HEADER_CRC_OFFSET + CRC.size
+    OUT_DATA_CRC_OFFSET = OUT_DATA_OFFSET + OUT_DATA.size
+    OUT_SIZE = OUT_DATA_CRC_OFFSET + CRC.size
 
     SPI_TRANSFERS = prometheus_client.Counter("pixtend_spi_transfers", "Successful spi transfers with pixtend")
     CRC_ERRORS = prometheus_client.Counter("pixtend_crc_errors", "CRC errors occurring in communication with pixtend", ["region"])
-    CRC_ERRORS.labels("header")
-    CRC_ERRORS.labels("data")
-
-    def __init__(self, communication_interval: float = 0.03, autostart=True):
+    # the labeled children are created upfront, so both regions are exported from the start
+    CRC_HEADER_ERRORS = CRC_ERRORS.labels("header")
+    CRC_DATA_ERRORS = CRC_ERRORS.labels("data")
+
+    __slots__ = (
+        "logger",
+        "transfer_lock",
+        "_communication_interval",
+        "_rt_priority",
+        "_model_out",
+        "_mode",
+        "_uc_ctrl_0",
+        "_uc_ctrl_1",
+        "_digital_debounce",
+        "_digital_out",
+        "_relay_out",
+        "_gpio_ctrl",
+        "_gpio_setting",
+        "_gpio_out",
+        "_gpio_debounce",
+        "_pwm",
+        "_retain_data_out",
+        "_firmware",
+        "_hardware",
+        "_model_in",
+        "_uc_state",
+        "_uc_warnings",
+        "_digital_in",
+        "_digital_in_change_mask",
+        "_analog_in_voltage",
+        "_analog_in_current",
+        "_gpio_in",
+        "_temp",
+        "_humid",
+        "_retain_data_in",
+        "_transfer_out",
+        "_transfer_out_view",
+        "_transfer_out_data_dirty",
+        "_mc_enable",
+        "_mc_reset",
+        "_spi",
+        "__communication_thread",
+        "__communication_thread_terminate",
+    )
+
+    def __init__(self, communication_interval: float = 0.03, autostart=True, rt_priority: typing.Optional[int] = None):
         super().__init__()
         self.logger = logging.getLogger(Pixtend.__name__)
 
-        self.transfer_lock = threading.RLock()
+        self.transfer_lock = threading.Lock()
 
         if communication_interval < 0.03:
             raise ValueError("The communication interval have to be at least 30 ms")
         self._communication_interval = communication_interval
+        # optional SCHED_FIFO priority of the communication thread, needs CAP_SYS_NICE
+        self._rt_priority = rt_priority
 
         self._model_out = ord("L")
         self._mode = 0
@@ -154,6 +230,8 @@ class Pixtend(common.Observable):
         self._relay_out = 0
 
         self._gpio_ctrl = 0
+        # decoded view of _gpio_ctrl, kept in sync by gpio_ctrl()
+        self._gpio_setting = [PixtendGPIOSetting.INPUT] * 4
         self._gpio_out = 0
         self._gpio_debounce = [0] * 2
 
@@ -168,6 +246,8 @@ class Pixtend(common.Observable):
         self._uc_warnings = 0
 
         self._digital_in = 0
+        # digital inputs which changed with the last transfer
+        self._digital_in_change_mask = 0
 
         self._analog_in_voltage = [0] * 4
         self._analog_in_current = [0] * 2
@@ -179,6 +259,12 @@ class Pixtend(common.Observable):
 
         self._retain_data_in = bytes()
 
+        # the output transfer is packed in place, no intermediate bytes objects per transfer
+        self._transfer_out = bytearray(self.OUT_SIZE)
+        self._transfer_out_view = memoryview(self._transfer_out)
+        # set by every output data mutator, the data region is only repacked if something changed
+        self._transfer_out_data_dirty = True
+
         self._mc_enable = GPIOOutput("Pixtend microcontroller spi enable", 18)
         self._mc_enable.state = LampState.ON
         self._mc_reset = GPIOOutput("Pixtend microcontroller reset", 16)
@@ -198,39 +284,69 @@ class Pixtend(common.Observable):
         logger.debug("Cleanup event received in Pixtend")
         self.stop_communication_thread()
 
-    def __del__(self):
+    def close(self):
+        """Stop the communication thread and release the spi device and the microcontroller control pins"""
         self.stop_communication_thread()
+        if self._spi is None:
+            return
         self._spi.close()
         self._spi = None
-        self._mc_enable.state = LampState.OFF
-        self._mc_reset.state = LampState.OFF
+        # closing the outputs switches them off before the pins are released
+        self._mc_enable.close()
+        self._mc_reset.close()
+
+    def __enter__(self) -> "Pixtend":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def _pack_output(self) -> bytearray:
+        transfer = self._transfer_out
+        view = self._transfer_out_view
 
-    def _pack_output(self) -> bytes:
         with self.transfer_lock:
-            header_data = self.OUT_HEADER.pack(self._model_out, self._mode, self._uc_ctrl_0, self._uc_ctrl_1)
-            data = self.OUT_DATA.pack(
-                *self._digital_debounce,
-                self._digital_out,
-                self._relay_out,
-                self._gpio_ctrl,
-                self._gpio_out,
-                *self._gpio_debounce,
-                *self._pwm,
-                self._retain_data_out
-            )
-
-        header_crc = _calc_crc16(header_data)
-        data_crc = _calc_crc16(data)
-
-        transfer = self.OUT_FORMAT.pack(header_data, header_crc, data, data_crc)
+            self.OUT_HEADER.pack_into(transfer, 0, self._model_out, self._mode, self._uc_ctrl_0, self._uc_ctrl_1)
+            # the transfer buffer is reused, so unchanged data and its crc are still in place from the last cycle
+            data_dirty = self._transfer_out_data_dirty
+            if data_dirty:
+                self.OUT_DATA.pack_into(
+                    transfer,
+                    self.OUT_DATA_OFFSET,
+                    *self._digital_debounce,
+                    self._digital_out,
+                    self._relay_out,
+                    self._gpio_ctrl,
+                    self._gpio_out,
+                    *self._gpio_debounce,
+                    *self._pwm,
+                    self._retain_data_out
+                )
+                self._transfer_out_data_dirty = False
+
+        self.CRC.pack_into(transfer, self.OUT_HEADER_CRC_OFFSET, _calc_crc16(view[: self.OUT_HEADER_CRC_OFFSET]))
+        if data_dirty:
+            self.CRC.pack_into(transfer, self.OUT_DATA_CRC_OFFSET, _calc_crc16(view[self.OUT_DATA_OFFSET : self.OUT_DATA_CRC_OFFSET]))
 
         return transfer
 
     def _unpack_input(self, transfer: bytes):
-        (header_data, header_crc) = self.IN_FORMAT_HEADER.unpack(transfer[: self.IN_FORMAT_HEADER.size])
-        if header_crc != _calc_crc16(header_data):
+        # parse the transfer in place instead of slicing copies out of it
+        view = memoryview(transfer)
+
+        (header_crc,) = self.CRC.unpack_from(view, self.IN_HEADER_CRC_OFFSET)
+        if header_crc != _calc_crc16(view[: self.IN_HEADER_CRC_OFFSET]):
             raise CrcHeaderError
 
+        header = self.IN_HEADER.unpack_from(view, 0)
+        # header field 2 is the model
+        model_valid = header[2] == self._model_out
+
+        (data_crc,) = self.CRC.unpack_from(view, self.IN_DATA_CRC_OFFSET)
+        data_valid = data_crc == _calc_crc16(view[self.IN_DATA_OFFSET : self.IN_DATA_CRC_OFFSET])
+        data = self.IN_DATA.unpack_from(view, self.IN_DATA_OFFSET) if model_valid and data_valid else None
+
+        # the checksums are verified outside, everything is stored within one lock acquisition
         with self.transfer_lock:
             (
                 self._firmware,
@@ -238,37 +354,25 @@ class Pixtend(common.Observable):
                 self._model_in,
                 self._uc_state,
                 self._uc_warnings,
-            ) = self.IN_HEADER.unpack(header_data)
-
-        if self._model_in != self._model_out:
+            ) = header
+
+            if data is not None:
+                previous_digital_in = self._digital_in
+                self._digital_in = data[0]
+                self._analog_in_voltage[:] = data[1:5]
+                self._analog_in_current[:] = data[5:7]
+                self._gpio_in = data[7]
+                # temperature and humidity are interleaved per channel
+                self._temp[:] = data[8:16:2]
+                self._humid[:] = data[9:16:2]
+                self._retain_data_in = data[16]
+                self._digital_in_change_mask = self._digital_in ^ previous_digital_in
+
+        if not model_valid:
             raise ModelError
-
-        (data, data_crc) = self.IN_FORMAT_DATA.unpack(transfer[self.IN_FORMAT_HEADER.size :])
-
-        if data_crc != _calc_crc16(data):
+        if not data_valid:
             raise CrcDataError
 
-        with self.transfer_lock:
-            (
-                self._digital_in,
-                self._analog_in_voltage[0],
-                self._analog_in_voltage[1],
-                self._analog_in_voltage[2],
-                self._analog_in_voltage[3],
-                self._analog_in_current[0],
-                self._analog_in_current[1],
-                self._gpio_in,
-                self._temp[0],
-                self._humid[0],
-                self._temp[1],
-                self._humid[1],
-                self._temp[2],
-                self._humid[2],
-                self._temp[3],
-                self._humid[3],
-                self._retain_data_in,
-            ) = self.IN_DATA.unpack(data)
-
     def start_communication_thread(self):
         if self.__communication_thread is not None:
             return warnings.warn(RuntimeWarning("Communication thread is already running"))
@@ -291,7 +395,8 @@ class Pixtend(common.Observable):
 
     def _spi_communicate(self):
         data = self._pack_output()
-        resp = bytes(self._spi.xfer2(list(data)))
+        # xfer2 takes any sequence of ints, the packed bytearray is converted on the C side
+        resp = bytes(self._spi.xfer2(data))
         try:
             self._unpack_input(resp)
             self.SPI_TRANSFERS.inc()
@@ -299,18 +404,32 @@ class Pixtend(common.Observable):
             self._trigger_observers()
         except CrcHeaderError:
             self.logger.warning("Error in header crc")
-            self.CRC_ERRORS.labels("header").inc()
+            self.CRC_HEADER_ERRORS.inc()
         except CrcDataError:
             self.logger.warning("Error in data crc")
-            self.CRC_ERRORS.labels("data").inc()
+            self.CRC_DATA_ERRORS.inc()
 
     def _spi_communication_loop(self):
-        next_com = timer()
-        while not self.__communication_thread_terminate.is_set():
-            self._spi_communicate()
-
-            next_com += self._communication_interval
-            now = timer()
+        if self._rt_priority is not None:
+            try:
+                # pid 0 refers to the calling thread
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self._rt_priority))
+            except (AttributeError, OSError) as e:
+                self.logger.warning("Could not set realtime priority %s for the communication thread: %s", self._rt_priority, e)
+
+        # the loop runs for the whole lifetime of the thread, so bind everything it needs once
+        terminated = self.__communication_thread_terminate.is_set
+        communicate = self._spi_communicate
+        interval = self._communication_interval
+        sleep = time.sleep
+        _timer = timer
+
+        next_com = _timer()
+        while not terminated():
+            communicate()
+
+            next_com += interval
+            now = _timer()
             if next_com < now:
                 # The next auto_mode already is in the past.
                 # We probably are not executing fast enough
@@ -322,7 +441,7 @@ class Pixtend(common.Observable):
 
             # Calculate the duration to the next auto mode deadline
             # and sleep until then.
-            time.sleep(next_com - now)
+            sleep(next_com - now)
 
     safe = _bit_getter_setter("_uc_ctrl_1", 0)
     retain_copy = _bit_getter_setter("_uc_ctrl_1", 1)
@@ -345,18 +464,31 @@ class Pixtend(common.Observable):
             raise ValueError("Digital output channel must be between 0 and 11")
         with self.transfer_lock:
             if val is not None:
-                if val:
-                    self._digital_out |= 1 << channel
-                else:
-                    self._digital_out &= ~(1 << channel)
+                self._digital_out = _set_bit(self._digital_out, channel, val)
+                self._transfer_out_data_dirty = True
             return self._digital_out & (1 << channel) > 0
 
+    def digital_outs(self, values: typing.Mapping[int, bool]):
+        """Set several digital output channels at once, they are transferred within the same cycle"""
+        for channel in values:
+            if not (0 <= channel <= 11):
+                raise ValueError("Digital output channel must be between 0 and 11")
+        with self.transfer_lock:
+            for channel, val in values.items():
+                self._digital_out = _set_bit(self._digital_out, channel, val)
+            self._transfer_out_data_dirty = True
+
     def digital_in(self, channel: int) -> bool:
         if not (0 <= channel <= 15):
             raise ValueError("Digital input channel must be between 0 and 15")
         with self.transfer_lock:
             return self._digital_in & (1 << channel) > 0
 
+    @property
+    def digital_in_change_mask(self) -> int:
+        """Bit mask of the digital input channels which changed with the last successful transfer"""
+        return self._digital_in_change_mask
+
     def digital_in_debounce_cycles(self, channel_duo: int, val: typing.Optional[int] = None) -> int:
         if not (0 <= channel_duo <= 7):
             raise ValueError("Digital debounce channel_duo must be between 0 and 7")
@@ -366,6 +498,7 @@ class Pixtend(common.Observable):
                 if not (0 <= val <= 255):
                     raise ValueError("Digital debounce cycles must be between 0 and 255")
                 self._digital_debounce[channel_duo] = val
+                self._transfer_out_data_dirty = True
             return self._digital_debounce[channel_duo]
 
     def digital_in_debounce_seconds(self, channel_duo: int, val: typing.Optional[float] = None) -> float:
@@ -379,10 +512,8 @@ class Pixtend(common.Observable):
             raise ValueError("Relay output channel must be between 0 and 3")
         with self.transfer_lock:
             if val is not None:
-                if val:
-                    self._relay_out |= 1 << channel
-                else:
-                    self._relay_out &= ~(1 << channel)
+                self._relay_out = _set_bit(self._relay_out, channel, val)
+                self._transfer_out_data_dirty = True
             return self._relay_out & (1 << channel) > 0
 
     def gpio_ctrl(self, channel: int, setting: PixtendGPIOSetting = None):
@@ -398,32 +529,25 @@ class Pixtend(common.Observable):
                     self._gpio_ctrl |= 1 << channel
                 elif setting is PixtendGPIOSetting.SENSOR:
                     self._gpio_ctrl |= 1 << (channel + 4)
-            channel_val = (self._gpio_ctrl >> channel) & 0b10001
-        if channel_val == 0:
-            return PixtendGPIOSetting.INPUT
-        elif channel_val == 1:
-            return PixtendGPIOSetting.OUTPUT
-        elif channel_val == 16:
-            return PixtendGPIOSetting.SENSOR
-        raise RuntimeError("Invalid value detected in gpio_ctrl byte")
+                self._gpio_setting[channel] = setting
+                self._transfer_out_data_dirty = True
+            return self._gpio_setting[channel]
 
     def gpio_out(self, channel: int, val: typing.Optional[bool] = None) -> bool:
         if not (0 <= channel <= 3):
             raise ValueError("GPIO output channel must be between 0 and 3")
-        if self.gpio_ctrl(channel) is not PixtendGPIOSetting.OUTPUT:
+        if self._gpio_setting[channel] is not PixtendGPIOSetting.OUTPUT:
             raise RuntimeError("GPIO channel must be configured as OUTPUT")
         with self.transfer_lock:
             if val is not None:
-                if val:
-                    self._gpio_out |= 1 << channel
-                else:
-                    self._gpio_out &= ~(1 << channel)
+                self._gpio_out = _set_bit(self._gpio_out, channel, val)
+                self._transfer_out_data_dirty = True
             return self._gpio_out & (1 << channel) > 0
 
     def gpio_in(self, channel: int) -> bool:
         if not (0 <= channel <= 3):
             raise ValueError("GPIO input channel must be between 0 and 3")
-        if self.gpio_ctrl(channel) is not PixtendGPIOSetting.INPUT:
+        if self._gpio_setting[channel] is not PixtendGPIOSetting.INPUT:
             raise RuntimeError("GPIO channel must be configured as INPUT")
         with self.transfer_lock:
             return self._gpio_in & (1 << channel) > 0
@@ -431,14 +555,12 @@ class Pixtend(common.Observable):
     def gpio_pullup(self, channel: int, val: typing.Optional[bool] = None) -> bool:
         if not (0 <= channel <= 3):
             raise ValueError("GPIO input channel must be between 0 and 3")
-        if self.gpio_ctrl(channel) is not PixtendGPIOSetting.INPUT:
+        if self._gpio_setting[channel] is not PixtendGPIOSetting.INPUT:
             raise RuntimeError("GPIO channel must be configured as INPUT")
         with self.transfer_lock:
             if val is not None:
-                if val:
-                    self._gpio_out |= 1 << channel
-                else:
-                    self._gpio_out &= ~(1 << channel)
+                self._gpio_out = _set_bit(self._gpio_out, channel, val)
+                self._transfer_out_data_dirty = True
             return self._gpio_out & (1 << channel) > 0
 
     def gpio_in_debounce_cycles(self, channel_duo: int, val: typing.Optional[int] = None):
@@ -450,6 +572,7 @@ class Pixtend(common.Observable):
                 if not (0 <= val <= 255):
                     raise ValueError("GPIO debounce cycles must be between 0 and 255")
                 self._gpio_debounce[channel_duo] = val
+                self._transfer_out_data_dirty = True
             return self._digital_debounce[channel_duo]
 
     def gpio_in_debounce_seconds(self, channel_duo: int) -> float:
@@ -467,6 +590,7 @@ class Pixtend(common.Observable):
             raise ValueError("Retain data are allowed to be 64 bytes")
         with self.transfer_lock:
             self._retain_data_out = val
+            self._transfer_out_data_dirty = True
 
     @property
     def retain_data_in(self) -> bytes:
@@ -477,13 +601,15 @@ class Pixtend(common.Observable):
         if not (0 <= channel <= 3):
             raise ValueError("Analog input voltage channel must be between 0 and 3")
         with self.transfer_lock:
-            return self._analog_in_voltage[channel] * 10 / 1024
+            raw = self._analog_in_voltage[channel]
+        return raw * self.ANALOG_VOLTAGE_SCALE
 
     def analog_in_current(self, channel) -> float:
         if not (4 <= channel <= 5):
             raise ValueError("Analog input current channel must be between 4 and 5")
         with self.transfer_lock:
-            return self._analog_in_current[channel - 4] * 0.020158400229358
+            raw = self._analog_in_current[channel - 4]
+        return raw * self.ANALOG_CURRENT_SCALE
 
     @property
     def watchdog(self) -> PixtendWatchDog:
@@ -500,6 +626,8 @@ class Pixtend(common.Observable):
 
 
 class PixtendButton(BaseButton):
+    __slots__ = ("_pixtend", "_channel", "_default_value", "_trigger_lock", "_old_value")
+
     DEBOUNCE_TIME = 50  # in ms
 
     def __init__(self, name: str, pixtend: Pixtend, channel: int, default_value=False):
@@ -515,12 +643,19 @@ class PixtendButton(BaseButton):
         self._pixtend.add_observer(self._pixtend_trigger)
 
     def _pixtend_trigger(self):
+        if not self._pixtend.digital_in_change_mask & (1 << self._channel):
+            # the common case, this input didn't change with the last transfer
+            return
         new_value = self._pixtend.digital_in(self._channel)
+        if new_value == self._old_value:
+            return
         with self._trigger_lock:
-            if new_value != self._old_value:
-                self._old_value = new_value
-                if new_value != self._default_value:
-                    self._trigger_observers()
+            # checked again, another thread may have handled the same change meanwhile
+            if new_value == self._old_value:
+                return
+            self._old_value = new_value
+            if new_value != self._default_value:
+                self._trigger_observers()
 
     def __repr__(self) -> str:
         return "{}(name={!r}, channel={!r}, default_value={!r}, pixtend={!r})".format(
@@ -533,6 +668,8 @@ class PixtendButton(BaseButton):
 
 
 class PixtendLamp(BaseLamp):
+    __slots__ = ("_pixtend", "_channel")
+
     def __init__(self, name: str, pixtend: Pixtend, channel: int, state: LampState = LampState.OFF):
         self._pixtend = pixtend
         self._channel = channel
@@ -554,6 +691,8 @@ class PixtendLamp(BaseLamp):
 
 
 class PixtendTriColorLamp(BaseTriColorLamp):
+    __slots__ = ("_pixtend", "_channel_1", "_channel_2")
+
     def __init__(
         self,
         name: str,
@@ -570,21 +709,23 @@ class PixtendTriColorLamp(BaseTriColorLamp):
             raise ValueError("Channel 1 must differ from channel 2 and vice versa")
         super().__init__(
             name=name,
-            on_callable=self._on_callable,
-            off_callable=self._off_callable,
+            on_callable=self._lamp_on,
+            off_callable=self._lamp_off,
             state=state,
             color=color,
         )
 
-    def _on_callable(self):
-        with self._pixtend.transfer_lock:
-            self._pixtend.digital_out(self._channel_1, bool(TriColorLampColor.GREEN & self._color))
-            self._pixtend.digital_out(self._channel_2, bool(TriColorLampColor.RED & self._color))
+    def _lamp_on(self):
+        color = self._color
+        self._pixtend.digital_outs(
+            {
+                self._channel_1: bool(TriColorLampColor.GREEN & color),
+                self._channel_2: bool(TriColorLampColor.RED & color),
+            }
+        )
 
-    def _off_callable(self):
-        with self._pixtend.transfer_lock:
-            self._pixtend.digital_out(self._channel_1, False)
-            self._pixtend.digital_out(self._channel_2, False)
+    def _lamp_off(self):
+        self._pixtend.digital_outs({self._channel_1: False, self._channel_2: False})
 
     def __repr__(self) -> str:
         return "{}(name={!r}, state={!r}, color={!r}, channel_1={!r}, channel_2={!r}, pixtend={!r})".format(
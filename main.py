@@ -4,6 +4,11 @@ import signal
 
 import symnet_cp
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from bermudafunk import base
 from bermudafunk.dispatcher import web
 from bermudafunk.dispatcher.data_types import Automat, DispatcherStudioDefinition, Studio
@@ -14,11 +19,14 @@ from bermudafunk.io.pixtend import Pixtend, PixtendButton, PixtendTriColorLamp
 
 async def main():
     def ask_exit(signame):
-        base.logger.error("got signal %s: exit" % signame)
+        base.logger.error("got signal %s: exit", signame)
         for task in asyncio.all_tasks():
             task.cancel()
 
     loop = asyncio.get_running_loop()
+    if hasattr(asyncio, "eager_task_factory"):
+        # python >= 3.12, tasks which finish without awaiting don't need a loop iteration
+        loop.set_task_factory(asyncio.eager_task_factory)
 
     for signame in {"SIGINT", "SIGTERM"}:
         loop.add_signal_handler(
@@ -26,7 +34,7 @@ async def main():
         )
 
     base.logger.debug("Main Start")
-    Observable.loop = asyncio.get_running_loop()
+    Observable.loop = loop
 
     pixtend = Pixtend(autostart=False)
 
@@ -34,7 +42,11 @@ async def main():
         local_address=(base.config.myIp, base.config.myPort), remote_address=(base.config.remoteIp, base.config.remotePort)
     )
 
-    main_selector = await device.define_selector(1, 8)
+    # both selectors are independent, so their definitions can run concurrently
+    main_selector, ukw_selector = await asyncio.gather(
+        device.define_selector(1, 8),
+        device.define_selector(2, 2),
+    )
 
     automat = Automat(
         main_lamp=PixtendTriColorLamp(
@@ -128,8 +140,6 @@ async def main():
     dispatcher.start()
     pixtend.start_communication_thread()
 
-    ukw_selector = await device.define_selector(2, 2)
-
     web_run_task = asyncio.create_task(web.run(dispatcher, ukw_selector))
     base.cleanup_tasks.append(web_run_task)
 
@@ -138,8 +148,15 @@ async def main():
             await asyncio.sleep(3600)
     except asyncio.CancelledError:
         await device.cleanup()
-        await asyncio.wait(base.cleanup_tasks)
+        # unlike asyncio.wait, failures of the cleanup tasks are not silently dropped
+        results = await asyncio.gather(*base.cleanup_tasks, return_exceptions=True)
+        for task, result in zip(base.cleanup_tasks, results):
+            if isinstance(result, Exception):
+                base.logger.error("Cleanup task %s failed", task.get_name(), exc_info=result)
+        pixtend.close()
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main(), debug=True)